@@ -9,118 +9,254 @@ required manual action and exits non-zero.
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
+import re
 import sys
-from dataclasses import dataclass, field
-from typing import Iterable, List, Optional
-
-import boto3
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 TEMPLATE_URL_DEFAULT = (
     "https://raw.githubusercontent.com/port-labs/port-ocean/main/"
     "integrations/aws-serverless/cloudformation/aws-serverless.template"
 )
 SERVICE_PRINCIPAL = "stacksets.cloudformation.amazonaws.com"
-
-
-@dataclass
+PERMISSION_MODELS = ("service-managed", "self-managed")
+MAX_WORKERS = 8
+REGIONS_PER_OPERATION = 10
+# Ask StackSets to deploy to all regions of an operation in parallel
+STACK_INSTANCE_OPERATION_PREFERENCES = {
+    "RegionConcurrencyType": "PARALLEL",
+    "MaxConcurrentPercentage": 100,
+    "FailureTolerancePercentage": 50,
+}
+_WEBHOOK_RE = re.compile(r"^https://[^\s/$.?#]\S*$")
+_ROLE_ARN_RE = re.compile(r"^arn:aws(?:-[a-z]+)*:iam::\d{12}:role/[\w+=,.@/-]+$")
+# Adaptive retries let botocore rate-limit itself under StackSets throttling
+BOTO_CONFIG_OPTIONS: Dict[str, Any] = {
+    "retries": {"max_attempts": 10, "mode": "adaptive"},
+    "max_pool_connections": 50,
+    "tcp_keepalive": True,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class PreflightIssue:
     level: str
     message: str
     remediation: str
 
 
-@dataclass
 class PreflightResult:
-    issues: List[PreflightIssue] = field(default_factory=list)
+    # Issues are stored column-wise; PreflightIssue rows are only built on demand
+    __slots__ = ("_levels", "_messages", "_remediations", "_error_count")
+
+    def __init__(self) -> None:
+        self._levels: List[str] = []
+        self._messages: List[str] = []
+        self._remediations: List[str] = []
+        self._error_count = 0
+
+    def __len__(self) -> int:
+        return len(self._levels)
 
     def add(self, level: str, message: str, remediation: str) -> None:
-        self.issues.append(PreflightIssue(level=level, message=message, remediation=remediation))
+        if level == "error":
+            self._error_count += 1
+        self._levels.append(level)
+        self._messages.append(message)
+        self._remediations.append(remediation)
+
+    @property
+    def issues(self) -> List[PreflightIssue]:
+        return [
+            PreflightIssue(level=level, message=message, remediation=remediation)
+            for level, message, remediation in zip(self._levels, self._messages, self._remediations)
+        ]
 
     @property
     def has_errors(self) -> bool:
-        return any(i.level == "error" for i in self.issues)
+        return self._error_count > 0
 
-    def render(self) -> str:
-        lines: List[str] = []
-        for issue in self.issues:
-            lines.append(f"[{issue.level.upper()}] {issue.message}")
-            lines.append(f"    Action: {issue.remediation}")
-        return "\n".join(lines)
+    def render(self) -> Iterable[str]:
+        for level, message, remediation in zip(self._levels, self._messages, self._remediations):
+            yield f"[{level.upper()}] {message}\n    Action: {remediation}"
+
+
+def _split_csv(val: Optional[str]) -> List[str]:
+    if not val:
+        return []
+    return [v for v in re.split(r"[,\s]+", val.strip()) if v]
+
+
+def _required_csv(val: str) -> List[str]:
+    parts = _split_csv(val)
+    if not parts:
+        raise argparse.ArgumentTypeError("at least one value is required")
+    return parts
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Preflight and deploy AWS StackSet for Port AWS Serverless integration")
-    parser.add_argument("--webhook-url", required=True, help="Port ingest webhook URL (https://…)")
+    parser.add_argument("--webhook-url", required=True, type=str.strip, help="Port ingest webhook URL (https://…)")
     parser.add_argument("--stackset-name", default="port-aws-serverless", help="StackSet name")
     parser.add_argument("--template-url", default=TEMPLATE_URL_DEFAULT, help="CloudFormation template URL")
     parser.add_argument("--queue-name", default="port-aws-events-queue", help="SQS queue name")
     parser.add_argument("--lambda-name", default="port-aws-event-processor", help="Lambda function name")
-    parser.add_argument("--event-sources", default="aws.ec2,aws.s3,aws.ecs", help="Comma-separated EventBridge sources")
-    parser.add_argument("--permission-model", choices=["service-managed", "self-managed"], default="service-managed", help="StackSets permission model")
+    parser.add_argument("--event-sources", type=_required_csv, default="aws.ec2,aws.s3,aws.ecs", help="Comma-separated EventBridge sources")
+    parser.add_argument("--permission-model", choices=PERMISSION_MODELS, default="service-managed", help="StackSets permission model")
     parser.add_argument("--admin-role-arn", help="Admin role ARN (self-managed only)")
     parser.add_argument("--execution-role-name", default="AWSCloudFormationStackSetExecutionRole", help="Execution role name in target accounts (self-managed)")
-    parser.add_argument("--target-ous", help="Comma-separated OU IDs for deployment (service-managed)")
-    parser.add_argument("--target-accounts", help="Comma-separated account IDs for deployment (self-managed)")
-    parser.add_argument("--regions", required=True, help="Space-separated or comma-separated regions for deployment")
+    parser.add_argument("--target-ous", type=_split_csv, default=[], help="Comma-separated OU IDs for deployment (service-managed)")
+    parser.add_argument("--target-accounts", type=_split_csv, default=[], help="Comma-separated account IDs for deployment (self-managed)")
+    parser.add_argument("--regions", required=True, type=_required_csv, help="Space-separated or comma-separated regions for deployment")
     parser.add_argument("--apply", action="store_true", help="If set, creates/updates StackSet and stack instances after preflight")
     return parser.parse_args()
 
 
-def _split_csv(val: Optional[str]) -> List[str]:
-    if not val:
-        return []
-    return [v.strip() for v in val.replace(" ", "").split(",") if v.strip()]
+def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parameters(
+    webhook_url: str, queue_name: str, lambda_name: str, event_sources: Tuple[str, ...]
+) -> Tuple[Mapping[str, str], ...]:
+    """Build the read-only CloudFormation parameter list shared by the StackSet and its instances."""
+    return tuple(
+        MappingProxyType({"ParameterKey": key, "ParameterValue": value})
+        for key, value in (
+            ("PortWebhookUrl", webhook_url),
+            ("QueueName", queue_name),
+            ("LambdaFunctionName", lambda_name),
+            ("SupportedEventSources", ",".join(event_sources)),
+        )
+    )
+
 
+@functools.lru_cache(maxsize=None)
+def _get_session():
+    """Return the boto3 session shared by all clients, so credentials resolve once.
+
+    boto3 is imported here so `--help` and argument errors don't pay for it.
+    """
+    import boto3
+
+    return boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(name: str):
+    """Return the boto3 client for an AWS service, creating it on first use.
+
+    Sessions are not thread-safe, so create clients before handing them to worker threads.
+    """
+    from botocore.config import Config
+
+    return _get_session().client(name, config=Config(**BOTO_CONFIG_OPTIONS))
+
+
+def _is_delegated_admin(orgs, account_id: str) -> bool:
+    """Page through StackSets delegated admins, stopping once the account is found."""
+    paginator = orgs.get_paginator("list_delegated_administrators")
+    for page in paginator.paginate(ServicePrincipal=SERVICE_PRINCIPAL):
+        if any(d["Id"] == account_id for d in page.get("DelegatedAdministrators", [])):
+            return True
+    return False
+
+
+def _has_trusted_access(orgs) -> bool:
+    """Page through enabled service principals, stopping once StackSets is found."""
+    paginator = orgs.get_paginator("list_aws_service_access_for_organization")
+    for page in paginator.paginate():
+        if any(s.get("ServicePrincipal") == SERVICE_PRINCIPAL for s in page.get("EnabledServicePrincipals", [])):
+            return True
+    return False
+
+
+def _run_concurrently(jobs: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """Run independent AWS calls in parallel.
+
+    Each label maps to the call's response, or to the ClientError it raised.
+    """
+    from botocore.exceptions import ClientError
+
+    results: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {label: executor.submit(job) for label, job in jobs.items()}
+        for label, future in futures.items():
+            try:
+                results[label] = future.result()
+            except ClientError as exc:
+                results[label] = exc
+    return results
+
+
+def preflight(args: argparse.Namespace, get_client: Callable[[str], Any]) -> PreflightResult:
+    from botocore.exceptions import ClientError
 
-def preflight(args: argparse.Namespace, sts, orgs, iam, cfn) -> PreflightResult:
     result = PreflightResult()
 
     # Basic webhook validation
-    if not args.webhook_url.startswith("http"):
+    if not _WEBHOOK_RE.match(args.webhook_url):
         result.add(
             "error",
-            "Webhook URL must start with http/https",
+            "Webhook URL must be a well-formed https:// URL",
             "Pass a full Port ingest webhook URL (https://ingest.getport.io/…)",
         )
 
     # Caller identity
     try:
-        identity = sts.get_caller_identity()
+        identity = get_client("sts").get_caller_identity()
         account_id = identity.get("Account")
     except ClientError as exc:
         result.add("error", f"STS get_caller_identity failed: {exc}", "Verify AWS credentials and permissions")
         return result
 
     # Permission model specifics
+    call_as = "SELF"
     if args.permission_model == "service-managed":
-        try:
-            org = orgs.describe_organization()["Organization"]
+        # The organization probes are independent of each other; issue them concurrently
+        orgs = get_client("organizations")
+        responses = _run_concurrently(
+            {
+                "organization": orgs.describe_organization,
+                "service_access": lambda: _has_trusted_access(orgs),
+            }
+        )
+        org_response = responses["organization"]
+        if isinstance(org_response, ClientError):
+            result.add("error", f"Failed to describe organization: {org_response}", "Ensure AWS Organizations is enabled and caller can access it")
+        else:
+            org = org_response["Organization"]
             management_account_id = org.get("MasterAccountId") or org.get("ManagementAccountId")
             if account_id != management_account_id:
                 # Allow delegated admin
-                delegated = orgs.list_delegated_administrators(ServicePrincipal=SERVICE_PRINCIPAL)
-                delegated_ids = {d["Id"] for d in delegated.get("DelegatedAdministrators", [])}
-                if account_id not in delegated_ids:
-                    result.add(
-                        "error",
-                        "Caller is not the management account or a delegated admin for StackSets",
-                        "Use the management account or register this account as a delegated admin for StackSets",
-                    )
-        except ClientError as exc:
-            result.add("error", f"Failed to describe organization: {exc}", "Ensure AWS Organizations is enabled and caller can access it")
-        else:
-            try:
-                access = orgs.list_aws_service_access_for_organization()
-                principals = {s.get("ServicePrincipal") for s in access.get("EnabledServicePrincipals", [])}
-                if SERVICE_PRINCIPAL not in principals:
-                    result.add(
-                        "error",
-                        "StackSets trusted access is not enabled for AWS Organizations",
-                        "Enable trusted access for AWS CloudFormation StackSets in the management account",
-                    )
-            except ClientError as exc:
-                result.add("error", f"Failed to check trusted access: {exc}", "Ensure org:ListAWSServiceAccessForOrganization permission")
+                try:
+                    if not _is_delegated_admin(orgs, account_id):
+                        result.add(
+                            "error",
+                            "Caller is not the management account or a delegated admin for StackSets",
+                            "Use the management account or register this account as a delegated admin for StackSets",
+                        )
+                    else:
+                        call_as = "DELEGATED_ADMIN"
+                except ClientError as exc:
+                    result.add("error", f"Failed to list delegated administrators: {exc}", "Ensure organizations:ListDelegatedAdministrators permission")
+
+            trusted_access = responses["service_access"]
+            if isinstance(trusted_access, ClientError):
+                result.add("error", f"Failed to check trusted access: {trusted_access}", "Ensure org:ListAWSServiceAccessForOrganization permission")
+            elif not trusted_access:
+                result.add(
+                    "error",
+                    "StackSets trusted access is not enabled for AWS Organizations",
+                    "Enable trusted access for AWS CloudFormation StackSets in the management account",
+                )
     else:
         if not args.admin_role_arn:
             result.add(
@@ -128,15 +264,12 @@ def preflight(args: argparse.Namespace, sts, orgs, iam, cfn) -> PreflightResult:
                 "Admin role ARN is required for self-managed StackSets",
                 "Pass --admin-role-arn for the StackSets admin role",
             )
-        else:
-            try:
-                iam.get_role(RoleName=args.admin_role_arn.split("/")[-1])
-            except ClientError as exc:
-                result.add(
-                    "warning",
-                    f"Unable to verify admin role ARN ({args.admin_role_arn}): {exc}",
-                    "Ensure the admin role exists and the caller can assume it",
-                )
+        elif not _ROLE_ARN_RE.match(args.admin_role_arn):
+            result.add(
+                "warning",
+                f"Admin role ARN does not look like an IAM role ARN: {args.admin_role_arn}",
+                "Pass the full ARN, e.g. arn:aws:iam::123456789012:role/AWSCloudFormationStackSetAdministrationRole",
+            )
         if not args.target_accounts:
             result.add(
                 "error",
@@ -144,22 +277,23 @@ def preflight(args: argparse.Namespace, sts, orgs, iam, cfn) -> PreflightResult:
                 "Pass --target-accounts as a comma-separated list",
             )
 
-    # CloudFormation visibility check
+    # CloudFormation visibility check; the result also tells the apply step whether the StackSet exists
+    args.call_as = call_as
+    args.existing_stackset = None
     try:
-        cfn.list_stack_sets(MaxResults=1)
+        args.existing_stackset = get_client("cloudformation").describe_stack_set(
+            StackSetName=args.stackset_name, CallAs=call_as
+        )["StackSet"]
     except ClientError as exc:
-        result.add(
-            "warning",
-            f"CloudFormation StackSets visibility check failed: {exc}",
-            "Ensure cloudformation:ListStackSets permission in the chosen permission model",
-        )
+        if exc.response.get("Error", {}).get("Code") != "StackSetNotFoundException":
+            result.add(
+                "warning",
+                f"CloudFormation StackSets visibility check failed: {exc}",
+                "Ensure cloudformation:DescribeStackSet permission in the chosen permission model",
+            )
 
     # Target scope checks
-    regions = _split_csv(args.regions) if "," in args.regions else args.regions.split()
-    if not regions:
-        result.add("error", "At least one region is required", "Provide regions via --regions")
-
-    if args.permission_model == "service-managed" and not _split_csv(args.target_ous):
+    if args.permission_model == "service-managed" and not args.target_ous:
         result.add(
             "warning",
             "No target OUs provided; no stack instances will be created",
@@ -169,12 +303,13 @@ def preflight(args: argparse.Namespace, sts, orgs, iam, cfn) -> PreflightResult:
     return result
 
 
-def create_stackset_and_instances(args: argparse.Namespace, cfn, regions: List[str]) -> None:
+def create_stackset_and_instances(args: argparse.Namespace, cfn) -> int:
+    from botocore.exceptions import ClientError
+
+    # botocore only accepts plain dicts, so thaw the cached parameters at the call site
     parameters = [
-        {"ParameterKey": "PortWebhookUrl", "ParameterValue": args.webhook_url},
-        {"ParameterKey": "QueueName", "ParameterValue": args.queue_name},
-        {"ParameterKey": "LambdaFunctionName", "ParameterValue": args.lambda_name},
-        {"ParameterKey": "SupportedEventSources", "ParameterValue": args.event_sources},
+        dict(p)
+        for p in _build_parameters(args.webhook_url, args.queue_name, args.lambda_name, tuple(args.event_sources))
     ]
 
     stackset_kwargs = {
@@ -183,60 +318,93 @@ def create_stackset_and_instances(args: argparse.Namespace, cfn, regions: List[s
         "Parameters": parameters,
         "Capabilities": ["CAPABILITY_NAMED_IAM"],
         "PermissionModel": "SERVICE_MANAGED" if args.permission_model == "service-managed" else "SELF_MANAGED",
+        "CallAs": args.call_as,
+        # Queue concurrent operations (one per region chunk) instead of rejecting them
+        "ManagedExecution": {"Active": True},
     }
 
     if args.permission_model == "self-managed":
         stackset_kwargs["AdministrationRoleARN"] = args.admin_role_arn
         stackset_kwargs["ExecutionRoleName"] = args.execution_role_name
 
-    try:
-        cfn.create_stack_set(**stackset_kwargs)
-        print(f"Created StackSet {args.stackset_name}")
-    except ClientError as exc:
-        if exc.response.get("Error", {}).get("Code") == "NameAlreadyExistsException":
-            print(f"StackSet {args.stackset_name} already exists; will reuse it")
-        else:
-            raise
+    # Only managed execution queues concurrent operations; a StackSet created
+    # without it rejects every region chunk after the first
+    managed_execution = False
+    if args.existing_stackset:
+        print(f"StackSet {args.stackset_name} already exists; will reuse it")
+        managed_execution = bool(args.existing_stackset.get("ManagedExecution", {}).get("Active"))
+    else:
+        try:
+            cfn.create_stack_set(**stackset_kwargs)
+            print(f"Created StackSet {args.stackset_name}")
+            managed_execution = True
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") == "NameAlreadyExistsException":
+                print(f"StackSet {args.stackset_name} already exists; will reuse it")
+            else:
+                raise
 
     # Create stack instances if targets provided
-    target_ous = _split_csv(args.target_ous)
-    target_accounts = _split_csv(args.target_accounts)
-    if args.permission_model == "service-managed" and not target_ous:
+    if args.permission_model == "service-managed" and not args.target_ous:
         print("No target OUs provided; skipping stack instance creation")
-        return
-    if args.permission_model == "self-managed" and not target_accounts:
+        return 0
+    if args.permission_model == "self-managed" and not args.target_accounts:
         print("No target accounts provided; skipping stack instance creation")
-        return
+        return 0
 
     instance_kwargs = {
         "StackSetName": args.stackset_name,
-        "Regions": regions,
         "ParameterOverrides": parameters,
+        "OperationPreferences": STACK_INSTANCE_OPERATION_PREFERENCES,
+        "CallAs": args.call_as,
     }
     if args.permission_model == "service-managed":
-        instance_kwargs["DeploymentTargets"] = {"OrganizationalUnitIds": target_ous}
+        instance_kwargs["DeploymentTargets"] = {"OrganizationalUnitIds": args.target_ous}
     else:
-        instance_kwargs["DeploymentTargets"] = {"Accounts": target_accounts}
+        instance_kwargs["DeploymentTargets"] = {"Accounts": args.target_accounts}
 
-    op = cfn.create_stack_instances(**instance_kwargs)
-    op_id = op.get("OperationId")
-    print(f"Started stack instances operation: {op_id}")
-    print(f"\nTo check status: aws cloudformation describe-stack-set-operation --stack-set-name {args.stackset_name} --operation-id {op_id}")
+    # boto3 clients are thread-safe for method calls, so the chunks share one client
+    if managed_execution:
+        chunks = list(_chunks(args.regions, REGIONS_PER_OPERATION))
+    else:
+        chunks = [list(args.regions)]
+    op_ids: List[str] = []
+    failed_regions: List[str] = []
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as executor:
+        futures = {
+            executor.submit(cfn.create_stack_instances, **instance_kwargs, Regions=regions): regions
+            for regions in chunks
+        }
+        for future in as_completed(futures):
+            regions = futures[future]
+            try:
+                op_id = future.result().get("OperationId")
+            except ClientError as exc:
+                # Keep going so operations that did start are still reported
+                failed_regions.extend(regions)
+                print(f"Failed to start stack instances operation for {', '.join(regions)}: {exc}")
+                continue
+            op_ids.append(op_id)
+            print(f"Started stack instances operation for {', '.join(regions)}: {op_id}")
+
+    if op_ids:
+        print("\nTo check status:")
+        for op_id in op_ids:
+            print(f"  aws cloudformation describe-stack-set-operation --stack-set-name {args.stackset_name} --operation-id {op_id}")
     print(f"To list instances: aws cloudformation list-stack-instances --stack-set-name {args.stackset_name}")
 
+    if failed_regions:
+        print(f"\nStack instance operations failed for regions: {', '.join(failed_regions)}")
+        return 1
+    return 0
+
 
 def main() -> int:
     args = parse_args()
-    regions = _split_csv(args.regions) if "," in args.regions else args.regions.split()
 
-    sts = boto3.client("sts")
-    orgs = boto3.client("organizations")
-    iam = boto3.client("iam")
-    cfn = boto3.client("cloudformation")
-
-    pre = preflight(args, sts, orgs, iam, cfn)
-    if pre.issues:
-        print(pre.render())
+    pre = preflight(args, get_client)
+    if pre:
+        sys.stdout.write("\n".join(pre.render()) + "\n")
     if pre.has_errors:
         print("Preflight failed; no actions were taken.")
         return 1
@@ -245,8 +413,7 @@ def main() -> int:
         print("Preflight passed. Re-run with --apply to create the StackSet and instances.")
         return 0
 
-    create_stackset_and_instances(args, cfn, regions)
-    return 0
+    return create_stackset_and_instances(args, get_client("cloudformation"))
 
 
 if __name__ == "__main__":
@@ -14,27 +14,79 @@ Flags:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import itertools
 import json
 import logging
 import os
+import random
 import sys
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncGenerator, Iterator
 
 try:
-    import boto3
     import httpx
     import yaml
 except ImportError:
     print("Error: Missing deps. Install: pip install boto3 httpx pyyaml", file=sys.stderr)
     sys.exit(1)
 
+# orjson is optional; it parses and serializes several times faster than json
+try:
+    import orjson
+
+    def dump_json(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def load_json(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def dump_json(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def load_json(data: bytes) -> Any:
+        return json.loads(data)
+
 # Constants
 SCRIPT_DIR = Path(__file__).resolve().parent
 LOCAL_PORT_RESOURCES = SCRIPT_DIR / ".port" / "resources"
 CLOUDFORMATION_TEMPLATE = SCRIPT_DIR / "cloudformation" / "aws-serverless.template"
+DEFAULT_INGEST_BASE_URL = "https://ingest.getport.io"
 MIN_WEBHOOK_ID_LENGTH = 10
 HTTP_SUCCESS_THRESHOLD = 300
+HTTP_CONFLICT = 409
+PORT_API_CONCURRENCY = 8
+# Resolved against the home directory when used; no home means no token cache
+TOKEN_CACHE_SUBDIR = Path(".cache") / "port-ocean"
+TOKEN_REFRESH_MARGIN_SECONDS = 120
+DEFAULT_TOKEN_TTL_SECONDS = 3600
+# Nested response fields that may carry the webhook URL or key, in lookup order
+WEBHOOK_NESTED_URL_PATHS = (("integration", "url"), ("webhook", "url"))
+WEBHOOK_NESTED_KEY_PATHS = (("integration", "webhookKey"), ("webhook", "webhookKey"))
+HTTP_RETRY_ATTEMPTS = 3
+# Multiplex concurrent Port API calls over one connection when httpx[http2] is installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTTP_RETRY_BASE_DELAY_SECONDS = 0.5
+# Upper bound on a server-requested Retry-After wait
+HTTP_RETRY_MAX_DELAY_SECONDS = 30.0
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# Waiter polls share the account's CloudFormation API quota with other tooling;
+# adaptive mode slows this client down instead of failing the deploy when throttled
+BOTO_CONFIG_OPTIONS = {"retries": {"mode": "adaptive", "max_attempts": 10}}
+# This stack settles in a few minutes; poll far more often than the 30s default
+# while keeping botocore's 60 minute ceiling (30s x 120 attempts)
+STACK_WAITER_CONFIG = {"Delay": 5, "MaxAttempts": 720}
+# Stack tag holding the hash of the last deployed template and parameters
+TEMPLATE_DIGEST_TAG = "PortTemplateDigest"
+STABLE_STACK_STATUSES = frozenset({"CREATE_COMPLETE", "UPDATE_COMPLETE"})
+SEPARATOR = "=" * 70
+
+# libyaml's C loader is much faster; fall back when PyYAML was built without it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 # Setup logging
 logging.basicConfig(
@@ -61,39 +113,139 @@ def load_env_file(env_file_path: Path) -> None:
     if not env_file_path.exists():
         raise PortSetupError(f"Env file not found: {env_file_path}")
 
+    parsed = {}
     with open(env_file_path) as f:
         for line in f:
             line = line.strip()
             if line and not line.startswith('#') and '=' in line:
                 key, value = line.split('=', 1)
-                os.environ[key.strip()] = value.strip().strip('"').strip("'")
+                parsed[key.strip()] = value.strip().strip('"\'')
+    os.environ.update(parsed)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: Path, loader: callable, mtime_ns: int) -> Any:
+    """Parse a config file once per modification time."""
+    return loader(path.read_bytes())
 
 
 def _load_config_file(filename: str, loader: callable) -> Any:
-    """Generic config file loader."""
+    """Generic config file loader.
+
+    Results are cached and shared between callers, so treat them as read-only.
+    """
     path = LOCAL_PORT_RESOURCES / filename
-    if not path.exists():
-        raise FileNotFoundError(f"Missing {filename} at {path}")
-    return loader(path.read_text())
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Missing {filename} at {path}") from None
+    return _parse_config_file(path, loader, mtime_ns)
+
+
+def _load_yaml(data: bytes) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(data, Loader=YAML_LOADER)
 
 
 def load_blueprints() -> list[dict[str, Any]]:
     """Load blueprints from JSON file."""
-    return _load_config_file("blueprints.json", json.loads)
+    return _load_config_file("blueprints.json", load_json)
 
 
 def load_port_app_config() -> dict[str, Any]:
     """Load Port app configuration from YAML file."""
-    return _load_config_file("port-app-config.yml", yaml.safe_load)
+    return _load_config_file("port-app-config.yml", _load_yaml)
+
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Retry throttled and transient 5xx responses with exponential backoff and jitter."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        attempts: int = HTTP_RETRY_ATTEMPTS
+    ) -> None:
+        self._transport = transport
+        self._attempts = attempts
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        attempt = 1
+        while response.status_code in RETRYABLE_STATUS_CODES and attempt < self._attempts:
+            await response.aclose()
+            delay = _retry_delay(response, attempt)
+            logger.warning(
+                "%s %s returned %s; retrying in %.1fs",
+                request.method, request.url.path, response.status_code, delay
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+            response = await self._transport.handle_async_request(request)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
 
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Honor a numeric Retry-After header up to a cap, else back off exponentially with jitter."""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), HTTP_RETRY_MAX_DELAY_SECONDS)
+    return HTTP_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1) * (1 + random.random())
 
-def get_port_access_token(client_id: str, client_secret: str, base_url: str) -> str:
-    """Obtain Port API access token.
+
+def make_port_client(base_url: str) -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by every Port API call.
 
     Args:
+        base_url: Port API base URL
+
+    Returns:
+        Client rooted at the Port API v1 prefix
+    """
+    # Connection errors are retried by the pool; throttling and 5xx by RetryTransport
+    transport = httpx.AsyncHTTPTransport(
+        retries=HTTP_RETRY_ATTEMPTS,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_keepalive_connections=50, max_connections=100, keepalive_expiry=60
+        ),
+    )
+    return httpx.AsyncClient(
+        base_url=f"{base_url.rstrip('/')}/v1",
+        headers={"Content-Type": "application/json"},
+        timeout=30.0,
+        transport=RetryTransport(transport),
+    )
+
+
+def _token_request(client: httpx.AsyncClient, client_id: str, client_secret: str) -> httpx.Request:
+    """Build the Port access token request."""
+    return client.build_request(
+        "POST",
+        "/auth/access_token",
+        content=dump_json({"clientId": client_id, "clientSecret": client_secret})
+    )
+
+
+def _store_token_response(cache_path: Path | None, response: httpx.Response) -> str:
+    """Cache the token from an access token response and return it."""
+    response.raise_for_status()
+    data = response.json()
+    _write_cached_token(
+        cache_path, data["accessToken"], data.get("expiresIn", DEFAULT_TOKEN_TTL_SECONDS)
+    )
+    return data["accessToken"]
+
+
+async def get_port_access_token(client: httpx.AsyncClient, client_id: str, client_secret: str) -> str:
+    """Obtain a fresh Port API access token and cache it.
+
+    Args:
+        client: Port API client
         client_id: Port client ID
         client_secret: Port client secret
-        base_url: Port API base URL
 
     Returns:
         Access token string
@@ -101,16 +253,116 @@ def get_port_access_token(client_id: str, client_secret: str, base_url: str) ->
     Raises:
         httpx.HTTPError: If authentication fails
     """
-    url = f"{base_url.rstrip('/')}/v1/auth/access_token"
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(
-            url,
-            json={"clientId": client_id, "clientSecret": client_secret}
-        )
-        response.raise_for_status()
-        return response.json()["accessToken"]
+    cache_path = _token_cache_path(client_id, str(client.base_url))
+    response = await client.send(_token_request(client, client_id, client_secret))
+    return _store_token_response(cache_path, response)
+
+
+def _token_cache_path(client_id: str, base_url: str) -> Path | None:
+    """Return the token cache file for a client ID and Port API URL.
+
+    Returns None when the home directory can't be resolved, e.g. under an
+    arbitrary container UID without HOME, which disables caching.
+    """
+    try:
+        cache_dir = Path.home() / TOKEN_CACHE_SUBDIR
+    except (RuntimeError, KeyError):
+        logger.debug("No home directory; Port access token will not be cached")
+        return None
+    digest = hashlib.sha256(f"{client_id}|{base_url}".encode()).hexdigest()
+    return cache_dir / f"token-{digest}.json"
+
+
+def _read_cached_token(cache_path: Path | None) -> str | None:
+    """Return the cached token if it isn't close to expiring."""
+    if cache_path is None:
+        return None
+    try:
+        cached = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+    if cached.get("exp", 0) - time.time() <= TOKEN_REFRESH_MARGIN_SECONDS:
+        return None
+    return cached.get("token")
 
 
+def _write_cached_token(cache_path: Path | None, token: str, expires_in: float) -> None:
+    """Persist a token readable only by the current user; failures are non-fatal."""
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"token": token, "exp": time.time() + expires_in}, f)
+    except OSError as e:
+        logger.debug("Could not cache Port access token: %s", e)
+
+
+class CachedTokenAuth(httpx.Auth):
+    """Bearer auth that replaces a rejected cached token once.
+
+    A cached token can be revoked, or outlive rotated credentials, before it
+    expires. The first 401 sent with it removes the cache file, requests a
+    fresh token and retries; concurrent requests wait for that refresh.
+    """
+
+    def __init__(
+        self, token: str, cache_path: Path | None, refresh_request: httpx.Request | None
+    ) -> None:
+        self._token = token
+        self._cache_path = cache_path
+        self._refresh_request = refresh_request
+        self._lock = asyncio.Lock()
+
+    async def async_auth_flow(
+        self, request: httpx.Request
+    ) -> AsyncGenerator[httpx.Request, httpx.Response]:
+        token = self._token
+        request.headers["Authorization"] = f"Bearer {token}"
+        response = yield request
+        if response.status_code != 401:
+            return
+        await response.aread()
+
+        async with self._lock:
+            if self._token == token:
+                if self._refresh_request is None:
+                    return
+                logger.warning(
+                    "Cached Port access token was rejected; removing %s and requesting a new one",
+                    self._cache_path
+                )
+                if self._cache_path is not None:
+                    self._cache_path.unlink(missing_ok=True)
+                refresh_response = yield self._refresh_request
+                # Overriding async_auth_flow bypasses httpx's automatic body read
+                await refresh_response.aread()
+                self._token = _store_token_response(self._cache_path, refresh_response)
+                self._refresh_request = None
+
+        request.headers["Authorization"] = f"Bearer {self._token}"
+        yield request
+
+
+async def authenticate_port_client(client: httpx.AsyncClient, client_id: str, client_secret: str) -> None:
+    """Attach bearer auth to the client for all subsequent requests.
+
+    A cached token is reused when it isn't close to expiring.
+    """
+    cache_path = _token_cache_path(client_id, str(client.base_url))
+    token = _read_cached_token(cache_path)
+    if token:
+        logger.debug("Using cached Port access token")
+        refresh_request = _token_request(client, client_id, client_secret)
+    else:
+        token = await get_port_access_token(client, client_id, client_secret)
+        refresh_request = None
+    client.auth = CachedTokenAuth(token, cache_path, refresh_request)
+
+
+@functools.lru_cache(maxsize=32)
 def normalize_webhook_identifier(value: str | None) -> str:
     """Extract webhook identifier from various input formats.
 
@@ -131,73 +383,84 @@ def normalize_webhook_identifier(value: str | None) -> str:
     return value
 
 
+def _walk(data: Any, keys: tuple[str, ...]) -> Any:
+    """Follow nested dict keys, returning None if the path is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
 def extract_webhook_key_from_response(data: dict[str, Any], ingest_base_url: str) -> str | None:
-    """Extract webhook key or URL from API response."""
-    base = ingest_base_url.rstrip('/')
-
-    # Try direct URL fields first
-    for path in ["url", "integration.url", "webhook.url"]:
-        value = data
-        for key in path.split('.'):
-            value = value.get(key, {}) if isinstance(value, dict) else None
-        if isinstance(value, str) and value.startswith(base):
+    """Extract webhook key or URL from API response.
+
+    ``ingest_base_url`` must already be stripped of its trailing slash.
+    """
+    # Fast path: the URL is usually a top-level field
+    try:
+        value = data["url"]
+    except KeyError:
+        value = None
+    if isinstance(value, str) and value.startswith(ingest_base_url):
+        return value
+
+    for path in WEBHOOK_NESTED_URL_PATHS:
+        value = _walk(data, path)
+        if isinstance(value, str) and value.startswith(ingest_base_url):
             return value
 
     # Try key/ID fields
-    for path in ["webhookKey", "integration.webhookKey", "webhook.webhookKey", "id", "_id"]:
-        value = data
-        for key in path.split('.'):
-            value = value.get(key, {}) if isinstance(value, dict) else None
+    candidates = itertools.chain(
+        (data.get("webhookKey"),),
+        (_walk(data, path) for path in WEBHOOK_NESTED_KEY_PATHS),
+        (data.get("id"), data.get("_id")),
+    )
+    for value in candidates:
         if isinstance(value, str) and len(value) >= MIN_WEBHOOK_ID_LENGTH and value.isalnum():
-            return f"{base}/{value}"
+            return f"{ingest_base_url}/{value}"
 
     return None
 
 
-def resolve_existing_webhook(
-    api_v1: str,
-    headers: dict[str, str],
+async def resolve_existing_webhook(
+    client: httpx.AsyncClient,
     identifier: str,
     ingest_base_url: str
 ) -> str | None:
     """Attempt to resolve existing webhook by identifier.
 
     Args:
-        api_v1: API v1 base URL
-        headers: HTTP headers for authentication
+        client: Port API client
         identifier: Webhook identifier
-        ingest_base_url: Base URL for webhook ingestion
+        ingest_base_url: Base URL for webhook ingestion, without trailing slash
 
     Returns:
         Webhook URL if found, None otherwise
     """
-    get_url = f"{api_v1}/webhooks/{identifier}"
-    logger.info(f"Checking for existing webhook: {identifier}...")
+    logger.info("Checking for existing webhook: %s...", identifier)
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(get_url, headers=headers)
-        logger.debug(f"Webhook GET status={response.status_code}")
-        logger.debug(f"Body: {response.text}")
+    response = await client.get(f"/webhooks/{identifier}")
+    logger.debug("Webhook GET status=%s", response.status_code)
+    logger.debug("Body: %s", response.text)
 
-        if response.status_code == 200:
-            return extract_webhook_key_from_response(response.json(), ingest_base_url)
+    if response.status_code == 200:
+        return extract_webhook_key_from_response(response.json(), ingest_base_url)
 
     return None
 
 
-def create_webhook(
-    api_v1: str,
-    headers: dict[str, str],
+async def create_webhook(
+    client: httpx.AsyncClient,
     identifier: str,
     ingest_base_url: str
 ) -> str:
     """Create new webhook in Port.
 
     Args:
-        api_v1: API v1 base URL
-        headers: HTTP headers for authentication
+        client: Port API client
         identifier: Webhook identifier
-        ingest_base_url: Base URL for webhook ingestion
+        ingest_base_url: Base URL for webhook ingestion, without trailing slash
 
     Returns:
         Webhook URL
@@ -219,35 +482,30 @@ def create_webhook(
         "mappings": []
     }
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(f"{api_v1}/webhooks", headers=headers, json=body)
-        if response.status_code >= HTTP_SUCCESS_THRESHOLD:
-            raise PortSetupError(
-                f"Failed to create webhook: {response.status_code} {response.text}"
-            )
+    response = await client.post("/webhooks", content=dump_json(body))
+    if response.status_code >= HTTP_SUCCESS_THRESHOLD:
+        raise PortSetupError(
+            f"Failed to create webhook: {response.status_code} {response.text}"
+        )
 
-        webhook_url = extract_webhook_key_from_response(response.json(), ingest_base_url)
-        if not webhook_url:
-            raise PortSetupError("Created webhook but ID not found in response")
+    webhook_url = extract_webhook_key_from_response(response.json(), ingest_base_url)
+    if not webhook_url:
+        raise PortSetupError("Created webhook but ID not found in response")
 
-        return webhook_url
+    return webhook_url
 
 
-def create_or_resolve_port_webhook(
-    base_url: str,
-    token: str,
-    integration_id: str,
+async def create_or_resolve_port_webhook(
+    client: httpx.AsyncClient,
     webhook_opt: str | None,
     ingest_base_url: str
 ) -> str:
     """Create or resolve Port webhook for integration.
 
     Args:
-        base_url: Port API base URL
-        token: Access token
-        integration_id: Integration identifier
+        client: Port API client
         webhook_opt: Optional webhook identifier or URL
-        ingest_base_url: Base URL for webhook ingestion
+        ingest_base_url: Base URL for webhook ingestion, without trailing slash
 
     Returns:
         Webhook URL
@@ -255,128 +513,131 @@ def create_or_resolve_port_webhook(
     Raises:
         PortSetupError: If webhook cannot be created or resolved
     """
-    api_v1 = f"{base_url.rstrip('/')}/v1"
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-
     # Handle direct URL or ID input
     if webhook_opt:
         if webhook_opt.startswith(("http://", "https://")):
-            if webhook_opt.startswith(ingest_base_url.rstrip('/')):
+            if webhook_opt.startswith(ingest_base_url):
                 return webhook_opt
-            return f"{ingest_base_url.rstrip('/')}/{webhook_opt.rstrip('/').split('/')[-1]}"
+            return f"{ingest_base_url}/{webhook_opt.rstrip('/').split('/')[-1]}"
 
         if len(webhook_opt) >= MIN_WEBHOOK_ID_LENGTH and webhook_opt.isalnum():
-            return f"{ingest_base_url.rstrip('/')}/{webhook_opt}"
+            return f"{ingest_base_url}/{webhook_opt}"
 
     # Try to resolve existing webhook
     identifier = normalize_webhook_identifier(webhook_opt)
-    webhook_url = resolve_existing_webhook(api_v1, headers, identifier, ingest_base_url)
+    webhook_url = await resolve_existing_webhook(client, identifier, ingest_base_url)
 
     if webhook_url:
         return webhook_url
 
     # Create new webhook if not found
-    return create_webhook(api_v1, headers, identifier, ingest_base_url)
+    return await create_webhook(client, identifier, ingest_base_url)
 
 
-def ensure_blueprints_exist(
-    api_v1: str,
-    headers: dict[str, str],
+def _blueprint_creation_waves(
+    blueprints: list[dict[str, Any]]
+) -> Iterator[list[dict[str, Any]]]:
+    """Group blueprints so each one is created after the blueprints it relates to."""
+    pending = {bp["identifier"]: bp for bp in blueprints}
+    while pending:
+        wave = [
+            bp for identifier, bp in pending.items()
+            if not any(
+                rel.get("target") in pending and rel.get("target") != identifier
+                for rel in (bp.get("relations") or {}).values()
+            )
+        ]
+        # A relation cycle can't be ordered; let the API report it
+        if not wave:
+            wave = list(pending.values())
+        for bp in wave:
+            del pending[bp["identifier"]]
+        yield wave
+
+
+async def ensure_blueprints_exist(
+    client: httpx.AsyncClient,
     blueprints: list[dict[str, Any]]
 ) -> None:
     """Ensure all blueprints exist in Port.
 
+    Blueprints are created concurrently in dependency order without a
+    prior existence check; a conflict response means it already exists.
+
     Args:
-        api_v1: API v1 base URL
-        headers: HTTP headers for authentication
+        client: Port API client
         blueprints: List of blueprint configurations
     """
     logger.info("\nCreating/updating blueprints...")
-
-    with httpx.Client(timeout=30.0) as client:
-        for blueprint in blueprints:
-            identifier = blueprint.get("identifier")
-            if not identifier:
-                logger.warning("  Skipping blueprint without identifier")
-                continue
-
-            logger.info(f"  Ensuring blueprint '{identifier}' exists...")
-
-            # Check if exists
-            response = client.get(f"{api_v1}/blueprints/{identifier}", headers=headers)
-            if response.status_code == 200:
-                logger.info("    Exists")
-                continue
-
-            # Create blueprint
-            response = client.post(
-                f"{api_v1}/blueprints",
-                headers=headers,
-                json=blueprint
+    semaphore = asyncio.Semaphore(PORT_API_CONCURRENCY)
+
+    async def create(blueprint: dict[str, Any]) -> None:
+        async with semaphore:
+            response = await client.post("/blueprints", content=dump_json(blueprint))
+        if response.status_code == HTTP_CONFLICT:
+            logger.info("  Exists '%s'", blueprint["identifier"])
+        elif response.status_code >= HTTP_SUCCESS_THRESHOLD:
+            logger.error(
+                "  Failed to create '%s': %s %s",
+                blueprint["identifier"], response.status_code, response.text
             )
-            if response.status_code >= HTTP_SUCCESS_THRESHOLD:
-                logger.error(f"    Failed: {response.status_code} {response.text}")
-            else:
-                logger.info("    Created")
+        else:
+            logger.info("  Created '%s'", blueprint["identifier"])
 
+    candidates = []
+    for blueprint in blueprints:
+        if not blueprint.get("identifier"):
+            logger.warning("  Skipping blueprint without identifier")
+            continue
+        candidates.append(blueprint)
 
-def update_integration_config(
-    client: httpx.Client,
-    integ_url: str,
-    headers: dict[str, str],
+    for wave in _blueprint_creation_waves(candidates):
+        await asyncio.gather(*(create(bp) for bp in wave))
+
+
+async def update_integration_config(
+    client: httpx.AsyncClient,
     port_app_config: dict[str, Any],
     integration_id: str,
-    api_v1: str,
-    force_recreate: bool
+    force_recreate: bool,
+    prefetched: httpx.Response | None = None
 ) -> None:
     """Update integration configuration with retry strategies.
 
     Args:
-        client: HTTP client
-        integ_url: Integration URL
-        headers: HTTP headers
+        client: Port API client
         port_app_config: Port app configuration
         integration_id: Integration identifier
-        api_v1: API v1 base URL
         force_recreate: Whether to force recreation if update fails
+        prefetched: Integration GET response fetched earlier, if any
     """
-    response = client.get(integ_url, headers=headers)
+    integ_url = f"/integration/{integration_id}"
+    response = prefetched if prefetched is not None else await client.get(integ_url)
 
     if response.status_code == 404:
-        _create_integration(client, api_v1, headers, integration_id, port_app_config)
+        await _create_integration(client, integration_id, port_app_config)
         return
 
     if response.status_code != 200:
-        logger.error(f"  Unexpected response: {response.status_code} {response.text}")
+        logger.error("  Unexpected response: %s %s", response.status_code, response.text)
         return
 
     # Update existing integration
     logger.info("  Integration exists, updating config...")
-    live_data = response.json()
-    patch_body = live_data.copy()
-    patch_body["config"] = port_app_config
-
-    # Remove read-only fields
-    for field in ["createdAt", "updatedAt", "ok"]:
-        patch_body.pop(field, None)
-
-    response = client.patch(integ_url, headers=headers, json=patch_body)
+    # PATCH is sparse, so only the config needs to be sent back
+    response = await client.patch(integ_url, content=dump_json({"config": port_app_config}))
     if response.status_code >= HTTP_SUCCESS_THRESHOLD:
-        logger.error(f"  Patch failed: {response.status_code} {response.text}")
+        logger.error("  Patch failed: %s %s", response.status_code, response.text)
     else:
         logger.info("  Updated integration config")
 
     # Verify update and retry if needed
-    if force_recreate and not _verify_config_present(client, integ_url, headers):
-        _retry_config_update(
-            client, integ_url, headers, port_app_config, integration_id, api_v1
-        )
+    if force_recreate and not await _verify_config_present(client, integ_url):
+        await _retry_config_update(client, integ_url, port_app_config, integration_id)
 
 
-def _create_integration(
-    client: httpx.Client,
-    api_v1: str,
-    headers: dict[str, str],
+async def _create_integration(
+    client: httpx.AsyncClient,
     integration_id: str,
     port_app_config: dict[str, Any]
 ) -> None:
@@ -390,20 +651,16 @@ def _create_integration(
         "config": port_app_config,
     }
 
-    response = client.post(f"{api_v1}/integration", headers=headers, json=body)
+    response = await client.post("/integration", content=dump_json(body))
     if response.status_code >= HTTP_SUCCESS_THRESHOLD:
-        logger.error(f"  Create failed: {response.status_code} {response.text}")
+        logger.error("  Create failed: %s %s", response.status_code, response.text)
     else:
         logger.info("  Created integration")
 
 
-def _verify_config_present(
-    client: httpx.Client,
-    integ_url: str,
-    headers: dict[str, str]
-) -> bool:
+async def _verify_config_present(client: httpx.AsyncClient, integ_url: str) -> bool:
     """Check if integration config has resources."""
-    response = client.get(integ_url, headers=headers)
+    response = await client.get(integ_url)
     if response.status_code != 200:
         return False
 
@@ -421,52 +678,49 @@ def _verify_config_present(
     return bool(resources)
 
 
-def _retry_config_update(
-    client: httpx.Client,
+async def _retry_config_update(
+    client: httpx.AsyncClient,
     integ_url: str,
-    headers: dict[str, str],
     port_app_config: dict[str, Any],
-    integration_id: str,
-    api_v1: str
+    integration_id: str
 ) -> None:
     """Retry configuration update using alternative methods."""
     logger.info("  Live config still empty; attempting subresource PATCH...")
 
     # Try subresource PATCH
     sub_url = f"{integ_url}/config"
-    response = client.patch(sub_url, headers=headers, json=port_app_config)
+    response = await client.patch(sub_url, content=dump_json(port_app_config))
 
     if response.status_code < HTTP_SUCCESS_THRESHOLD:
         logger.info("  Subresource config PATCH succeeded; verifying...")
-        if _verify_config_present(client, integ_url, headers):
+        if await _verify_config_present(client, integ_url):
             logger.info("  ✓ Config now present after subresource PATCH")
             return
 
     # Fall back to delete and recreate
     logger.info("  Config still empty after subresource PATCH; recreating integration...")
 
-    response = client.delete(integ_url, headers=headers)
+    response = await client.delete(integ_url)
     if response.status_code >= HTTP_SUCCESS_THRESHOLD:
-        logger.error(f"  Delete failed: {response.status_code} {response.text}")
+        logger.error("  Delete failed: %s %s", response.status_code, response.text)
         return
 
-    _create_integration(client, api_v1, headers, integration_id, port_app_config)
+    await _create_integration(client, integration_id, port_app_config)
     logger.info("  ✓ Integration recreated with config")
 
 
-def _apply_webhook_mappings(api_v1: str, headers: dict, webhook_id: str) -> None:
+async def _apply_webhook_mappings(client: httpx.AsyncClient, webhook_id: str) -> None:
     """Apply webhook mappings for EventBridge events.
 
     Args:
-        api_v1: Port API v1 URL
-        headers: Request headers with auth token
+        client: Port API client
         webhook_id: Webhook identifier
     """
     if not webhook_id:
         logger.warning("No webhook identifier provided, skipping mappings")
         return
 
-    mappings_url = f"{api_v1}/webhooks/{webhook_id}/mapping"
+    mappings_url = f"/webhooks/{webhook_id}/mapping"
 
     # EventBridge event mappings
     mappings = {
@@ -491,15 +745,14 @@ def _apply_webhook_mappings(api_v1: str, headers: dict, webhook_id: str) -> None
     }
 
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(mappings_url, json=mappings, headers=headers)
-            response.raise_for_status()
-            logger.info(f"Applied webhook mappings for {webhook_id}")
+        response = await client.post(mappings_url, content=dump_json(mappings))
+        response.raise_for_status()
+        logger.info("Applied webhook mappings for %s", webhook_id)
     except httpx.HTTPError as e:
-        logger.error(f"Failed to apply webhook mappings: {e}")
+        logger.error("Failed to apply webhook mappings: %s", e)
 
 
-def setup_port_resources(
+async def setup_port_resources(
     client_id: str,
     client_secret: str,
     base_url: str,
@@ -522,38 +775,36 @@ def setup_port_resources(
     Returns:
         Webhook URL
     """
-    token = get_port_access_token(client_id, client_secret, base_url)
-    api_v1 = f"{base_url.rstrip('/')}/v1"
-    headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+    ingest_base = ingest_base_url.rstrip('/')
 
     logger.info("\nLoading blueprints and config from local .port/resources...")
     blueprints = load_blueprints()
     port_app_config = load_port_app_config()
 
-    ensure_blueprints_exist(api_v1, headers, blueprints)
+    async with make_port_client(base_url) as client:
+        await authenticate_port_client(client, client_id, client_secret)
 
-    webhook_url = create_or_resolve_port_webhook(
-        base_url, token, integration_id, webhook_opt, ingest_base_url
-    )
-
-    # Apply webhook mappings for EventBridge events
-    _apply_webhook_mappings(
-        api_v1, headers, normalize_webhook_identifier(webhook_opt)
-    )
-
-    logger.info(f"\nSetting up integration '{integration_id}'...")
-    integ_url = f"{api_v1}/integration/{integration_id}"
+        # Blueprints, webhook and the integration lookup don't depend on each other
+        _, webhook_url, integration_response = await asyncio.gather(
+            ensure_blueprints_exist(client, blueprints),
+            create_or_resolve_port_webhook(client, webhook_opt, ingest_base),
+            client.get(f"/integration/{integration_id}"),
+        )
 
-    with httpx.Client(timeout=30.0) as client:
-        update_integration_config(
-            client, integ_url, headers, port_app_config,
-            integration_id, api_v1, force_recreate
+        logger.info("\nSetting up integration '%s'...", integration_id)
+        await asyncio.gather(
+            # Apply webhook mappings for EventBridge events
+            _apply_webhook_mappings(client, normalize_webhook_identifier(webhook_opt)),
+            update_integration_config(
+                client, port_app_config, integration_id, force_recreate,
+                prefetched=integration_response
+            ),
         )
 
     return webhook_url
 
 
-def verify_mappings(
+async def verify_mappings(
     client_id: str,
     client_secret: str,
     base_url: str,
@@ -570,17 +821,14 @@ def verify_mappings(
     logger.info("\nVerifying integration mappings (local vs live)...")
 
     try:
-        token = get_port_access_token(client_id, client_secret, base_url)
-        api_v1 = f"{base_url.rstrip('/')}/v1"
-        integ_url = f"{api_v1}/integration/{integration_id}"
-
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(integ_url, headers={"Authorization": f"Bearer {token}"})
+        async with make_port_client(base_url) as client:
+            await authenticate_port_client(client, client_id, client_secret)
+            response = await client.get(f"/integration/{integration_id}")
 
             if response.status_code != 200:
                 logger.error(
-                    f"  ERROR: Failed to fetch live integration: "
-                    f"{response.status_code} {response.text}"
+                    "  ERROR: Failed to fetch live integration: %s %s",
+                    response.status_code, response.text
                 )
                 return
 
@@ -594,10 +842,10 @@ def verify_mappings(
             else:
                 logger.info("  Mapping differences:")
                 for diff in diffs:
-                    logger.info(f"    - {diff}")
+                    logger.info("    - %s", diff)
 
     except Exception as e:
-        logger.warning(f"  WARN: Mapping verification failed: {type(e).__name__}: {e}")
+        logger.warning("  WARN: Mapping verification failed: %s: %s", type(e).__name__, e)
 
 
 def _compare_configs(live_cfg: dict[str, Any], local_cfg: dict[str, Any]) -> list[str]:
@@ -610,36 +858,21 @@ def _compare_configs(live_cfg: dict[str, Any], local_cfg: dict[str, Any]) -> lis
     Returns:
         List of difference descriptions
     """
-    live_resources = live_cfg.get("resources") or []
-    local_resources = local_cfg.get("resources") or []
-
-    def index_by_kind(resources: list[dict]) -> dict[str, dict]:
-        return {r.get("kind"): r for r in resources if r.get("kind")}
-
-    live_idx = index_by_kind(live_resources)
-    local_idx = index_by_kind(local_resources)
+    live_idx = _index_mappings_by_kind(live_cfg.get("resources") or [])
+    local_idx = _index_mappings_by_kind(local_cfg.get("resources") or [])
 
     diffs = []
-    all_kinds = sorted(set(live_idx) | set(local_idx))
-
-    for kind in all_kinds:
-        local_resource = local_idx.get(kind)
-        live_resource = live_idx.get(kind)
-
-        if not live_resource:
+    for kind in sorted(live_idx.keys() | local_idx.keys()):
+        if kind not in live_idx:
             diffs.append(f"MISSING in live: {kind}")
             continue
 
-        if not local_resource:
+        if kind not in local_idx:
             diffs.append(f"EXTRA in live: {kind}")
             continue
 
-        # Compare mappings
-        def get_mappings(resource: dict) -> dict:
-            return resource.get("port", {}).get("entity", {}).get("mappings", {})
-
-        local_mappings = get_mappings(local_resource)
-        live_mappings = get_mappings(live_resource)
+        local_mappings = local_idx[kind]
+        live_mappings = live_idx[kind]
 
         diffs.extend(_compare_mapping_fields(kind, local_mappings, live_mappings))
         diffs.extend(_compare_properties(kind, local_mappings, live_mappings))
@@ -648,6 +881,16 @@ def _compare_configs(live_cfg: dict[str, Any], local_cfg: dict[str, Any]) -> lis
     return diffs
 
 
+def _get_entity_mappings(resource: dict) -> dict:
+    """Return a resource's port.entity.mappings, treating missing levels as empty."""
+    return ((resource.get("port") or {}).get("entity") or {}).get("mappings") or {}
+
+
+def _index_mappings_by_kind(resources: list[dict]) -> dict[str, dict]:
+    """Map each resource kind to its entity mappings in a single pass."""
+    return {r["kind"]: _get_entity_mappings(r) for r in resources if r.get("kind")}
+
+
 def _compare_mapping_fields(
     kind: str,
     local_mappings: dict,
@@ -670,24 +913,12 @@ def _compare_properties(
     live_mappings: dict
 ) -> list[str]:
     """Compare properties between local and live."""
-    local_props = local_mappings.get("properties", {}) or {}
-    live_props = live_mappings.get("properties", {}) or {}
-
-    diffs = []
-    for key in local_props.keys() - live_props.keys():
-        diffs.append(f"MISSING property in live {kind}.{key}")
-
-    for key in live_props.keys() - local_props.keys():
-        diffs.append(f"EXTRA property in live {kind}.{key}")
-
-    for key in local_props.keys() & live_props.keys():
-        if local_props[key] != live_props[key]:
-            diffs.append(
-                f"DIFF property {kind}.{key}: "
-                f"live={live_props[key]} local={local_props[key]}"
-            )
-
-    return diffs
+    return _compare_named_entries(
+        kind,
+        "property",
+        local_mappings.get("properties", {}) or {},
+        live_mappings.get("properties", {}) or {},
+    )
 
 
 def _compare_relations(
@@ -696,23 +927,32 @@ def _compare_relations(
     live_mappings: dict
 ) -> list[str]:
     """Compare relations between local and live."""
-    local_rels = local_mappings.get("relations", {}) or {}
-    live_rels = live_mappings.get("relations", {}) or {}
-
-    diffs = []
-    for key in local_rels.keys() - live_rels.keys():
-        diffs.append(f"MISSING relation in live {kind}.{key}")
+    return _compare_named_entries(
+        kind,
+        "relation",
+        local_mappings.get("relations", {}) or {},
+        live_mappings.get("relations", {}) or {},
+    )
 
-    for key in live_rels.keys() - local_rels.keys():
-        diffs.append(f"EXTRA relation in live {kind}.{key}")
 
-    for key in local_rels.keys() & live_rels.keys():
-        if local_rels[key] != live_rels[key]:
+def _compare_named_entries(
+    kind: str,
+    label: str,
+    local_entries: dict,
+    live_entries: dict
+) -> list[str]:
+    """Report missing, extra and changed entries in a single pass over both key sets."""
+    diffs = []
+    for key in sorted(local_entries.keys() | live_entries.keys()):
+        if key not in live_entries:
+            diffs.append(f"MISSING {label} in live {kind}.{key}")
+        elif key not in local_entries:
+            diffs.append(f"EXTRA {label} in live {kind}.{key}")
+        elif local_entries[key] != live_entries[key]:
             diffs.append(
-                f"DIFF relation {kind}.{key}: "
-                f"live={live_rels[key]} local={local_rels[key]}"
+                f"DIFF {label} {kind}.{key}: "
+                f"live={live_entries[key]} local={local_entries[key]}"
             )
-
     return diffs
 
 
@@ -740,13 +980,20 @@ def deploy_cloudformation_stack(
     Raises:
         PortSetupError: If deployment fails
     """
-    logger.info(f"\nDeploying CloudFormation stack '{stack_name}' in {region}...")
+    logger.info("\nDeploying CloudFormation stack '%s' in %s...", stack_name, region)
 
-    if not CLOUDFORMATION_TEMPLATE.exists():
-        raise PortSetupError(f"Missing template {CLOUDFORMATION_TEMPLATE}")
+    try:
+        mtime_ns = CLOUDFORMATION_TEMPLATE.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise PortSetupError(f"Missing template {CLOUDFORMATION_TEMPLATE}") from None
 
-    template_body = CLOUDFORMATION_TEMPLATE.read_text()
-    cf_client = boto3.client("cloudformation", region_name=region)
+    template_body = _read_template(CLOUDFORMATION_TEMPLATE, mtime_ns)
+    session = _get_boto_session()
+    from botocore.config import Config
+
+    cf_client = session.client(
+        "cloudformation", region_name=region, config=Config(**BOTO_CONFIG_OPTIONS)
+    )
 
     params = [
         {"ParameterKey": "QueueName", "ParameterValue": queue_name},
@@ -755,15 +1002,27 @@ def deploy_cloudformation_stack(
         {"ParameterKey": "SupportedEventSources", "ParameterValue": event_sources},
     ]
 
-    try:
-        stack_exists = _check_stack_exists(cf_client, stack_name)
+    digest = _deployment_digest(template_body, params)
 
-        if stack_exists:
-            _update_stack(cf_client, stack_name, template_body, params)
+    try:
+        stack = _describe_stack(cf_client, stack_name)
+        tags = {t["Key"]: t["Value"] for t in (stack or {}).get("Tags", [])}
+
+        # Only a stack that settled successfully is known to match the digest
+        if (
+            tags.get(TEMPLATE_DIGEST_TAG) == digest
+            and stack["StackStatus"] in STABLE_STACK_STATUSES
+        ):
+            logger.info("  Template and parameters unchanged; skipping update")
         else:
-            _create_stack(cf_client, stack_name, template_body, params)
+            tags[TEMPLATE_DIGEST_TAG] = digest
+            tag_list = [{"Key": k, "Value": v} for k, v in tags.items()]
+            if stack:
+                _update_stack(cf_client, stack_name, template_body, params, tag_list)
+            else:
+                _create_stack(cf_client, stack_name, template_body, params, tag_list)
+            stack = cf_client.describe_stacks(StackName=stack_name)["Stacks"][0]
 
-        stack = cf_client.describe_stacks(StackName=stack_name)["Stacks"][0]
         outputs = {o["OutputKey"]: o["OutputValue"] for o in stack.get("Outputs", [])}
 
         logger.info("\n✓ Stack deployment completed successfully")
@@ -773,14 +1032,45 @@ def deploy_cloudformation_stack(
         raise PortSetupError(f"CloudFormation failed: {type(e).__name__}: {e}")
 
 
-def _check_stack_exists(cf_client: Any, stack_name: str) -> bool:
-    """Check if CloudFormation stack exists."""
+def _get_boto_session() -> Any:
+    """Create the boto3 session for the CloudFormation deployment.
+
+    boto3 is imported here rather than at module load, so Port-only and
+    dry runs never import it and a missing install is reported as a setup error.
+    """
+    try:
+        import boto3
+    except ImportError:
+        raise PortSetupError("Missing deps. Install: pip install boto3 httpx pyyaml")
+    return boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=2)
+def _read_template(path: Path, mtime_ns: int) -> str:
+    """Read a template once per modification time."""
+    return path.read_text()
+
+
+def _deployment_digest(template_body: str, params: list[dict]) -> str:
+    """Hash the template and parameters so unchanged deployments can be detected."""
+    hasher = hashlib.sha256(template_body.encode())
+    hasher.update(json.dumps(params, sort_keys=True).encode())
+    return hasher.hexdigest()
+
+
+def _is_validation_error(error: Any, message_fragment: str) -> bool:
+    """Check a botocore ClientError for a CloudFormation ValidationError with the given message."""
+    details = error.response.get("Error", {})
+    return details.get("Code") == "ValidationError" and message_fragment in details.get("Message", "")
+
+
+def _describe_stack(cf_client: Any, stack_name: str) -> dict[str, Any] | None:
+    """Return the CloudFormation stack description, or None if it doesn't exist."""
     try:
-        cf_client.describe_stacks(StackName=stack_name)
-        return True
+        return cf_client.describe_stacks(StackName=stack_name)["Stacks"][0]
     except cf_client.exceptions.ClientError as e:
-        if "does not exist" in str(e):
-            return False
+        if _is_validation_error(e, "does not exist"):
+            return None
         raise
 
 
@@ -788,7 +1078,8 @@ def _update_stack(
     cf_client: Any,
     stack_name: str,
     template_body: str,
-    params: list[dict]
+    params: list[dict],
+    tags: list[dict]
 ) -> None:
     """Update existing CloudFormation stack."""
     logger.info("  Updating existing stack...")
@@ -798,13 +1089,14 @@ def _update_stack(
             StackName=stack_name,
             TemplateBody=template_body,
             Parameters=params,
-            Capabilities=["CAPABILITY_NAMED_IAM"]
+            Capabilities=["CAPABILITY_NAMED_IAM"],
+            Tags=tags
         )
         waiter = cf_client.get_waiter("stack_update_complete")
         logger.info("  Waiting for update to complete...")
-        waiter.wait(StackName=stack_name)
+        waiter.wait(StackName=stack_name, WaiterConfig=STACK_WAITER_CONFIG)
     except cf_client.exceptions.ClientError as e:
-        if "No updates are to be performed" in str(e):
+        if _is_validation_error(e, "No updates are to be performed"):
             logger.info("  No updates required")
         else:
             raise
@@ -814,7 +1106,8 @@ def _create_stack(
     cf_client: Any,
     stack_name: str,
     template_body: str,
-    params: list[dict]
+    params: list[dict],
+    tags: list[dict]
 ) -> None:
     """Create new CloudFormation stack."""
     logger.info("  Creating new stack...")
@@ -823,11 +1116,12 @@ def _create_stack(
         StackName=stack_name,
         TemplateBody=template_body,
         Parameters=params,
-        Capabilities=["CAPABILITY_NAMED_IAM"]
+        Capabilities=["CAPABILITY_NAMED_IAM"],
+        Tags=tags
     )
     waiter = cf_client.get_waiter("stack_create_complete")
     logger.info("  Waiting for creation to complete...")
-    waiter.wait(StackName=stack_name)
+    waiter.wait(StackName=stack_name, WaiterConfig=STACK_WAITER_CONFIG)
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -852,8 +1146,11 @@ def parse_arguments() -> argparse.Namespace:
     )
     parser.add_argument(
         "--ingest-base-url",
-        default=os.environ.get("PORT_INGEST_BASE_URL", "https://ingest.getport.io"),
-        help="Port ingest base URL fallback if webhook URL not returned"
+        default=None,
+        help=(
+            "Port ingest base URL fallback if webhook URL not returned "
+            f"(default: $PORT_INGEST_BASE_URL or {DEFAULT_INGEST_BASE_URL})"
+        )
     )
     parser.add_argument(
         "--aws-region",
@@ -921,9 +1218,9 @@ def parse_arguments() -> argparse.Namespace:
 
 def print_banner() -> None:
     """Print installation banner."""
-    print("=" * 70)
+    print(SEPARATOR)
     print("AWS Serverless Port Integration - Standalone Installation")
-    print("=" * 70)
+    print(SEPARATOR)
 
 
 def validate_credentials() -> tuple[str, str]:
@@ -962,7 +1259,31 @@ def print_configuration(args: argparse.Namespace) -> None:
     ]
     logger.info("\nConfiguration:")
     for label, value in config:
-        logger.info(f"  {label}: {value}")
+        logger.info("  %s: %s", label, value)
+
+
+def build_cloudformation_cli(args: argparse.Namespace, webhook_url: str) -> str:
+    """Build the equivalent AWS CLI deploy command for manual or dry runs.
+
+    Args:
+        args: Parsed arguments
+        webhook_url: Webhook URL
+
+    Returns:
+        Shell command string
+    """
+    return (
+        f"aws cloudformation deploy "
+        f"--stack-name {args.stack_name} "
+        f"--template-file cloudformation/aws-serverless.template "
+        f"--region {args.aws_region} "
+        f"--capabilities CAPABILITY_NAMED_IAM "
+        f"--parameter-overrides "
+        f"QueueName={args.queue_name} "
+        f"LambdaFunctionName={args.lambda_function_name} "
+        f"PortWebhookUrl={webhook_url} "
+        f'SupportedEventSources="{args.event_sources}"'
+    )
 
 
 def print_summary(
@@ -977,22 +1298,22 @@ def print_summary(
         webhook_url: Webhook URL
         outputs: CloudFormation outputs (if deployed)
     """
-    logger.info("\n" + "=" * 70)
+    logger.info("\n%s", SEPARATOR)
     logger.info("INSTALLATION COMPLETE")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
     logger.info("\nPort Resources:")
-    logger.info(f"  Integration ID: {args.integration_id}")
-    logger.info(f"  Webhook URL: {webhook_url}")
+    logger.info("  Integration ID: %s", args.integration_id)
+    logger.info("  Webhook URL: %s", webhook_url)
     logger.info("\nAWS Resources:")
-    logger.info(f"  Region: {args.aws_region}")
-    logger.info(f"  Stack Name: {args.stack_name}")
+    logger.info("  Region: %s", args.aws_region)
+    logger.info("  Stack Name: %s", args.stack_name)
 
     if outputs:
         for key, value in outputs.items():
-            logger.info(f"  {key}: {value}")
+            logger.info("  %s: %s", key, value)
 
     logger.info("\nThe integration is now active and will route AWS events to Port.")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
 
 
 def main() -> None:
@@ -1007,18 +1328,25 @@ def main() -> None:
 
         # Load environment file if specified
         if args.env_file:
-            logger.info(f"Loading environment variables from: {args.env_file}")
+            logger.info("Loading environment variables from: %s", args.env_file)
             load_env_file(args.env_file)
 
+        # Resolved after the .env file so it can provide PORT_INGEST_BASE_URL
+        args.ingest_base_url = (
+            args.ingest_base_url
+            or os.environ.get("PORT_INGEST_BASE_URL")
+            or DEFAULT_INGEST_BASE_URL
+        )
+
         # Validate credentials
         client_id, client_secret = validate_credentials()
 
         print_configuration(args)
 
         # Step 1: Port setup
-        logger.info("\n" + "=" * 70)
+        logger.info("\n%s", SEPARATOR)
         logger.info("STEP 1: Setting up Port resources")
-        logger.info("=" * 70)
+        logger.info(SEPARATOR)
 
         if args.dry_run:
             logger.info(
@@ -1027,7 +1355,7 @@ def main() -> None:
             )
             webhook_url = "<simulated-webhook-url>"
         else:
-            webhook_url = setup_port_resources(
+            webhook_url = asyncio.run(setup_port_resources(
                 client_id,
                 client_secret,
                 args.port_base_url,
@@ -1035,42 +1363,29 @@ def main() -> None:
                 args.webhook,
                 args.ingest_base_url,
                 force_recreate=args.force_recreate
-            )
-            logger.info(f"\n✓ Port setup complete. Webhook URL: {webhook_url}")
+            ))
+            logger.info("\n✓ Port setup complete. Webhook URL: %s", webhook_url)
 
             if args.verify_mappings:
-                verify_mappings(
+                asyncio.run(verify_mappings(
                     client_id,
                     client_secret,
                     args.port_base_url,
                     args.integration_id
-                )
+                ))
 
         # Step 2: AWS deployment
-        logger.info("\n" + "=" * 70)
+        logger.info("\n%s", SEPARATOR)
         logger.info("STEP 2: Deploying AWS infrastructure")
-        logger.info("=" * 70)
-
-        cf_cli = (
-            f"aws cloudformation deploy "
-            f"--stack-name {args.stack_name} "
-            f"--template-file cloudformation/aws-serverless.template "
-            f"--region {args.aws_region} "
-            f"--capabilities CAPABILITY_NAMED_IAM "
-            f"--parameter-overrides "
-            f"QueueName={args.queue_name} "
-            f"LambdaFunctionName={args.lambda_function_name} "
-            f"PortWebhookUrl={webhook_url} "
-            f'SupportedEventSources="{args.event_sources}"'
-        )
+        logger.info(SEPARATOR)
 
         outputs = None
         if args.dry_run:
             logger.info("[DRY-RUN] Would run CloudFormation deployment:")
-            logger.info(cf_cli)
+            logger.info(build_cloudformation_cli(args, webhook_url))
         elif args.port_only:
             logger.info("Port setup complete. To deploy AWS resources, run:")
-            logger.info(cf_cli)
+            logger.info(build_cloudformation_cli(args, webhook_url))
         else:
             outputs = deploy_cloudformation_stack(
                 args.stack_name,
@@ -1084,13 +1399,13 @@ def main() -> None:
         print_summary(args, webhook_url, outputs)
 
     except PortSetupError as e:
-        logger.error(f"\nERROR: {e}")
+        logger.error("\nERROR: %s", e)
         sys.exit(1)
     except KeyboardInterrupt:
         logger.info("\n\nInterrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"\nUnexpected error: {type(e).__name__}: {e}")
+        logger.error("\nUnexpected error: %s: %s", type(e).__name__, e)
         if args.debug:
             raise
         sys.exit(1)
@@ -2,31 +2,61 @@
 """Send an AWS event payload to a webhook for testing.
 
 Usage:
-    python send_sample_event.py <webhook_url> <event_file.json>
+    python send_sample_event.py [--verbose] <webhook_url> <event_file.json>
 """
 
 import argparse
 import json
 from pathlib import Path
+from typing import Any
 
 import httpx
 
+# orjson is optional; it parses and serializes payloads faster than json
+try:
+    import orjson
+
+    def load_json(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def pretty_json(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    def dump_json(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def load_json(data: bytes) -> Any:
+        return json.loads(data)
+
+    def pretty_json(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    def dump_json(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 
 def load_event(path: Path) -> dict:
     """Load an event payload from a JSON file."""
     if not path.exists():
         raise FileNotFoundError(f"Event file not found: {path}")
-    return json.loads(path.read_text())
+    return load_json(path.read_bytes())
 
 
-def send_event(webhook_url: str, event: dict) -> None:
+def send_event(webhook_url: str, event: dict, verbose: bool = False) -> None:
     """Send an event payload to the webhook."""
     print(f"\nSending event to {webhook_url}...")
-    print(f"Event payload: {json.dumps(event, indent=2)}\n")
+    if verbose:
+        print(f"Event payload: {pretty_json(event)}\n")
+    else:
+        print(f"Event payload: {len(event)} top-level keys\n")
 
     try:
         with httpx.Client(timeout=10.0) as client:
-            response = client.post(webhook_url, json=event)
+            response = client.post(
+                webhook_url,
+                content=dump_json(event),
+                headers={"Content-Type": "application/json"},
+            )
             print(f"Response: {response.status_code}")
             if response.text:
                 print(f"Body: {response.text}")
@@ -43,6 +73,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Send a JSON event payload to a Port webhook")
     parser.add_argument("webhook_url", help="Full webhook URL (e.g., https://ingest.getport.io/<id>)")
     parser.add_argument("event_file", type=Path, help="Path to JSON file containing the event payload")
+    parser.add_argument("--verbose", action="store_true", help="Print the full event payload before sending")
     return parser.parse_args()
 
 
@@ -66,7 +97,7 @@ def main() -> None:
     print(f"Event File:   {args.event_file}")
     print("=" * 70)
 
-    send_event(args.webhook_url, event)
+    send_event(args.webhook_url, event, verbose=args.verbose)
 
 
 if __name__ == "__main__":